@@ -12,7 +12,7 @@ import shutil
 
 from .imports import RAVEN_LOC
 from .heron_types import HeronCase, Component, Source
-from .naming_utils import get_capacity_vars, get_component_activity_vars, get_opt_objective
+from .naming_utils import get_capacity_vars, get_component_activity_vars
 
 from .raven_template import RavenTemplate
 from .snippets.runinfo import RunInfo
@@ -213,9 +213,9 @@ class OuterTemplate(RavenTemplate):
     raven = self._template.find("Models/Code[@subType='RAVEN']")  # type: RavenCode
 
     # Find the RAVEN executable to use
-    exec_path = RAVEN_LOC / "raven_framework"
-    if exec_path.resolve().exists():
-      executable = str(exec_path.resolve())
+    exec_path = (RAVEN_LOC / "raven_framework").resolve()
+    if exec_path.exists():
+      executable = str(exec_path)
     elif shutil.which("raven_framework") is not None:
       executable = "raven_framework"
     else:
@@ -230,12 +230,10 @@ class OuterTemplate(RavenTemplate):
     raven.add_alias("denoises", loc=self.inner_sampler)
 
     # Add variable aliases for Inner
-    for component in components:
-      raven.add_alias(component.name, suffix="capacity", loc=self.inner_sampler)
+    raven.add_aliases([component.name for component in components], suffix="capacity", loc=self.inner_sampler)
 
     # Add label aliases for Inner
-    for label in case.get_labels():
-      raven.add_alias(label, suffix="label", loc=self.inner_sampler)
+    raven.add_aliases(case.get_labels(), suffix="label", loc=self.inner_sampler)
 
     return raven
 
@@ -247,11 +245,11 @@ class OuterTemplate(RavenTemplate):
     @ Out, None
     """
     # Set up some helpful variable groups
-    capacities_vargroup = self._template.find("VariableGroups/Group[@name='GRO_capacities']")
+    capacities_vargroup = self._by_name[("Group", "GRO_capacities")]
     capacities_vars = list(get_capacity_vars(components, self.namingTemplates["variable"]))
     capacities_vargroup.variables.extend(capacities_vars)
 
-    results_vargroup = self._template.find("VariableGroups/Group[@name='GRO_outer_results']")
+    results_vargroup = self._by_name[("Group", "GRO_outer_results")]
     results_vars = self._get_statistical_results_vars(case, components)
     results_vargroup.variables.extend(results_vars)
 
@@ -293,13 +291,13 @@ class OuterTemplateOpt(OuterTemplate):
       raise ValueError(f"Template does not recognize optimization strategy {opt_strategy}.")
 
     # Set optimizer <TargetEvaluation> data object
-    results_data = self._template.find("DataObjects/PointSet[@name='opt_eval']")
+    results_data = self._by_name[("PointSet", "opt_eval")]
     optimizer.target_evaluation = results_data
 
     # Set optimizer objective function
-    objective = get_opt_objective(case)
+    objective = self._get_opt_objective(case)
     optimizer.objective = objective
-    results = self._template.find("VariableGroups/Group[@name='GRO_outer_results']")  # type: VariableGroup
+    results = self._by_name[("Group", "GRO_outer_results")]  # type: VariableGroup
     if objective not in results.variables:
       results.variables.insert(0, objective)
 
@@ -307,7 +305,7 @@ class OuterTemplateOpt(OuterTemplate):
     self._add_labels_to_sampler(optimizer, case.get_labels())
 
     # Add the optimizer and any custom function files to the main MultiRun step
-    multirun = self._template.find("Steps/MultiRun[@name='optimize']")  # type: MultiRun
+    multirun = self._by_name[("MultiRun", "optimize")]  # type: MultiRun
     for func in self._get_function_files(sources):
       multirun.add_input(func)
     multirun.add_optimizer(optimizer)
@@ -340,9 +338,9 @@ class OuterTemplateSweep(OuterTemplate):
     # Populate the sampled and constant capacities in the Grid sampler
     sampler = self._template.find("Samplers/Grid")  # type: Grid
     variables, consts = self._create_sampler_variables(case, components)
-    for sampled_var, vals in variables.items():
+    for sampled_var, vals in variables:
       sampler.add_variable(sampled_var)
-      sampled_var.use_grid(construction="custom", kind="value", values=sorted(vals))
+      sampled_var.use_grid(construction="custom", kind="value", values=vals)
     for var_name, val in consts.items():
       sampler.add_constant(var_name, val)
 
@@ -351,7 +349,7 @@ class OuterTemplateSweep(OuterTemplate):
 
     # If there are any case labels, make a variable group for those and add it to the "grid" PointSet.
     # These labels also need to get added to the sampler as constants.
-    grid_results = self._template.find("DataObjects/PointSet[@name='grid']")  # type: PointSet
+    grid_results = self._by_name[("PointSet", "grid")]  # type: PointSet
     labels = case.get_labels()
     if labels:
       vargroup = self._create_case_labels_vargroup(labels)
@@ -404,17 +402,17 @@ class InnerTemplate(RavenTemplate):
     activity_vars = get_component_activity_vars(components, self.namingTemplates["tot_activity"])
     econ_vars = case.get_econ_metrics(nametype="output")
     output_vars = econ_vars + activity_vars
-    self._template.find("VariableGroups/Group[@name='GRO_dispatch_out']").variables.extend(output_vars)
-    self._template.find("VariableGroups/Group[@name='GRO_timeseries_out_scalar']").variables.extend(output_vars)
-    self._template.find("DataObjects/PointSet[@name='arma_metrics']").outputs.extend(output_vars)
+    self._by_name[("Group", "GRO_dispatch_out")].variables.extend(output_vars)
+    self._by_name[("Group", "GRO_timeseries_out_scalar")].variables.extend(output_vars)
+    self._by_name[("PointSet", "arma_metrics")].outputs.extend(output_vars)
 
     # Figure out what result statistics are being used
-    vg_final_return = self._template.find("VariableGroups/Group[@name='GRO_metrics_stats']")
+    vg_final_return = self._by_name[("Group", "GRO_metrics_stats")]
     results_vars = self._get_statistical_results_vars(case, components)
     vg_final_return.variables.extend(results_vars)
 
     # Fill out the econ postprocessor statistics
-    econ_pp = self._template.find("Models/PostProcessor[@name='statistics']")
+    econ_pp = self._by_name[("PostProcessor", "statistics")]
     for stat, variable in self._get_stats_for_econ_postprocessor(case, econ_vars, activity_vars):
       econ_pp.append(stat.to_element(variable))
 
@@ -438,8 +436,8 @@ class InnerTemplate(RavenTemplate):
     @ Out, None
     """
     # Work out how the inner results should be routed back to the outer
-    metrics_stats = self._template.find("DataObjects/PointSet[@name='metrics_stats']")
-    write_metrics_stats = self._template.find("Steps/IOStep[@name='database']")
+    metrics_stats = self._by_name[("PointSet", "metrics_stats")]
+    write_metrics_stats = self._by_name[("IOStep", "database")]
     self._dispatch_results_name = "disp_results"
     data_handling = case.data_handling["inner_to_outer"]
     if data_handling == "csv":
@@ -489,12 +487,15 @@ class InnerTemplate(RavenTemplate):
 
     vg_case_labels = VariableGroup("GRO_case_labels")
     self._add_snippet(vg_case_labels)
-    self._template.find("VariableGroups/Group[@name='GRO_timeseries_in_scalar']").variables.append(vg_case_labels.name)
-    self._template.find("VariableGroups/Group[@name='GRO_dispatch_in_scalar']").variables.append(vg_case_labels.name)
+    self._by_name[("Group", "GRO_timeseries_in_scalar")].variables.append(vg_case_labels.name)
+    self._by_name[("Group", "GRO_dispatch_in_scalar")].variables.append(vg_case_labels.name)
+    label_names = []
+    variable_fmt = self.namingTemplates["variable"].format
     for k, label_val in case_labels.items():
-      label_name = self.namingTemplates["variable"].format(unit=k, feature="label")
-      vg_case_labels.variables.append(label_name)
+      label_name = variable_fmt(unit=k, feature="label")
+      label_names.append(label_name)
       sampler.add_constant(label_name, label_val)
+    vg_case_labels.variables = label_names
 
   def _set_time_vars(self, time_name: str, year_name: str) -> None:
     """
@@ -503,14 +504,14 @@ class InnerTemplate(RavenTemplate):
     @ In, year_name, str, name of year variable
     @ Out, None
     """
-    group = self._template.find("VariableGroups/Group[@name='GRO_dispatch']")
+    group = self._by_name[("Group", "GRO_dispatch")]
     group.variables.extend([time_name, year_name])
 
-    for time_index in self._template.findall("DataObjects/DataSet/Index[@var='Time']"):
-      time_index.set("var", time_name)
-
-    for year_index in self._template.findall("DataObjects/DataSet/Index[@var='Year']"):
-      year_index.set("var", year_name)
+    # Rename the placeholder index variables in a single pass over the DataSet indices
+    index_names = {"Time": time_name, "Year": year_name}
+    for index in self._template.iterfind("DataObjects/DataSet/Index"):
+      if (new_name := index_names.get(index.get("var"))) is not None:
+        index.set("var", new_name)
 
   def _add_uncertain_econ_params(self,
                                  sampler: Sampler,
@@ -523,15 +524,15 @@ class InnerTemplate(RavenTemplate):
     @ In, distributions, list[Distribution], distributions to be sampled from
     @ Out, vg_econ_uq, VariableGroup, a VariableGroup with the economic parameter names
     """
-    vg_econ_uq = self._template.find("VariableGroups/Group[@name='GRO_UQ']")
+    vg_econ_uq = self._by_name.get(("Group", "GRO_UQ"))
     if vg_econ_uq is None:
       vg_econ_uq = VariableGroup("GRO_UQ")
       self._add_snippet(vg_econ_uq)
     # Add the SampledVariable and Distribution nodes to the appropriate locations
     for samp_var, dist in zip(variables, distributions):
       self._add_snippet(dist)
-      vg_econ_uq.variables.append(samp_var.name)
       sampler.add_variable(samp_var)
+    vg_econ_uq.variables.extend(samp_var.name for samp_var in variables)
     return vg_econ_uq
 
   def _add_constant_caps_to_sampler(self, sampler: Sampler, components: list[Component]) -> None:
@@ -541,7 +542,7 @@ class InnerTemplate(RavenTemplate):
     @ In, components, list[Component], the case components
     @ Out, None
     """
-    capacities_vargroup = self._template.find("VariableGroups/Group[@name='GRO_capacities']")  # type: VariableGroup
+    capacities_vargroup = self._by_name[("Group", "GRO_capacities")]  # type: VariableGroup
     capacities_vars = get_capacity_vars(components, self.namingTemplates["variable"])
     capacities_vargroup.variables.extend(list(capacities_vars))
     for k, v in capacities_vars.items():
@@ -569,7 +570,7 @@ class InnerTemplateSyntheticHistory(InnerTemplate):
     self._add_time_series_roms(ensemble_model, case, sources)
 
     # Determine which variables are sampled by the Monte Carlo sampler
-    mc = self._template.find("Samplers/MonteCarlo[@name='mc_arma_dispatch']")  # type: MonteCarlo
+    mc = self._by_name[("MonteCarlo", "mc_arma_dispatch")]  # type: MonteCarlo
     # default sampler init
     mc.init_seed = 42
     mc.init_limit = 3
@@ -584,8 +585,8 @@ class InnerTemplateSyntheticHistory(InnerTemplate):
     if len(sampled_vars) > 0:
       # Create a VariableGroup for the uncertain econ parameters
       vg_econ_uq = self._add_uncertain_econ_params(mc, sampled_vars, distributions)
-      self._template.find("VariableGroups/Group[@name='GRO_dispatch_in_scalar']").variables.append(vg_econ_uq.name)
-      self._template.find("VariableGroups/Group[@name='GRO_timeseries_in_scalar']").variables.append(vg_econ_uq.name)
+      self._by_name[("Group", "GRO_dispatch_in_scalar")].variables.append(vg_econ_uq.name)
+      self._by_name[("Group", "GRO_timeseries_in_scalar")].variables.append(vg_econ_uq.name)
 
 
 class InnerTemplateStaticHistory(InnerTemplate):
@@ -613,7 +614,7 @@ class InnerTemplateStaticHistory(InnerTemplate):
     # Add the outer capacities as constants here
     #   - component capacities (constants)
     #     - add variables to GRO_capacities
-    capacities_vargroup = self._template.find("VariableGroups/Group[@name='GRO_capacities']")  # type: VariableGroup
+    capacities_vargroup = self._by_name[("Group", "GRO_capacities")]  # type: VariableGroup
     capacities_vars = get_capacity_vars(components, self.namingTemplates["variable"])
     capacities_vargroup.variables.extend(list(capacities_vars))
     for k, v in capacities_vars.items():
@@ -631,8 +632,8 @@ class InnerTemplateStaticHistory(InnerTemplate):
       mc.init_limit = case.get_num_samples()
       # Create a VariableGroup for the uncertain econ parameters
       vg_econ_uq = self._add_uncertain_econ_params(mc, sampled_vars, distributions)
-      self._template.find("VariableGroups/Group[@name='GRO_dispatch_in_scalar']").variables.append(vg_econ_uq.name)
-      self._template.find("VariableGroups/Group[@name='GRO_timeseries_in_scalar']").variables.append(vg_econ_uq.name)
+      self._by_name[("Group", "GRO_dispatch_in_scalar")].variables.append(vg_econ_uq.name)
+      self._by_name[("Group", "GRO_timeseries_in_scalar")].variables.append(vg_econ_uq.name)
 
       # Combine the MonteCarlo and CustomSampler samplers in an EnsembleForward sampler.
       ensemble_sampler = self._create_ensemble_forward_sampler(custom_sampler, mc)
@@ -644,5 +645,5 @@ class InnerTemplateStaticHistory(InnerTemplate):
       sampler = custom_sampler
 
     # Set the sampler to be used in the main MultiRun
-    multirun = self._template.find("Steps/MultiRun[@name='arma_sampling']")
+    multirun = self._by_name[("MultiRun", "arma_sampling")]
     multirun.add_sampler(sampler)
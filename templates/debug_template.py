@@ -6,6 +6,8 @@
   @author: Jacob Bryan (@j-bryan)
   @date: 2024-12-23
 """
+import itertools as it
+
 from .raven_template import RavenTemplate
 
 from .snippets.models import EnsembleModel
@@ -45,7 +47,7 @@ class DebugTemplate(RavenTemplate):
     self._update_dataset_indices(case)
 
     # Add optional plots
-    debug_iostep = self._template.find("Steps/IOStep[@name='debug_output']")
+    debug_iostep = self._by_name[("IOStep", "debug_output")]
     if case.debug["dispatch_plot"]:
       disp_plot = self._make_dispatch_plot(case)
       self._add_snippet(disp_plot)
@@ -66,8 +68,9 @@ class DebugTemplate(RavenTemplate):
     # there. Otherwise, if only a CustomSampler is used, we'll add them to the CustomSampler.
 
     # What time series sources does our case have?
-    has_arma_source = any(s.is_type("ARMA") for s in sources)
-    has_csv_source = any(s.is_type("CSV") for s in sources)
+    source_types = {s.type for s in sources}
+    has_arma_source = "ARMA" in source_types
+    has_csv_source = "CSV" in source_types
 
     # What variables need to be sampled and which are constants?
     cap_vars, cap_consts = self._create_sampler_variables(case, components)  # capacities
@@ -83,15 +86,16 @@ class DebugTemplate(RavenTemplate):
       monte_carlo = MonteCarlo("mc")
 
       # Set number of samples for sampler
-      monte_carlo.denoises = case.get_num_samples()
-      monte_carlo.init_limit = case.get_num_samples()
+      num_samples = case.get_num_samples()
+      monte_carlo.denoises = num_samples
+      monte_carlo.init_limit = num_samples
 
       # Set up case to use synthetic history ROM
       if has_arma_source:
         self._use_time_series_rom(monte_carlo, case, sources)
 
       # Add capacities to sampler
-      for sampled_var in cap_vars:
+      for sampled_var, _ in cap_vars:
         monte_carlo.add_variable(sampled_var)
       for var_name, val in cap_consts.items():
         monte_carlo.add_constant(var_name, val)
@@ -99,13 +103,13 @@ class DebugTemplate(RavenTemplate):
       # Add uncertain cashflow parameters
       if has_uncertain_cashflows:
         vg_econ_uq = find_node(self._template, "VariableGroups/Group[@name='GRO_UQ']")  # type: VariableGroup
-        self._template.find("VariableGroups/Group[@name='GRO_dispatch_in_scalar']").variables.append(vg_econ_uq.name)
-        self._template.find("VariableGroups/Group[@name='GRO_timeseries_in_scalar']").variables.append(vg_econ_uq.name)
+        self._by_name[("Group", "GRO_dispatch_in_scalar")].variables.append(vg_econ_uq.name)
+        self._by_name[("Group", "GRO_timeseries_in_scalar")].variables.append(vg_econ_uq.name)
         # Add the SampledVariable and Distribution nodes to the appropriate locations
         for samp_var, dist in zip(cashflow_vars, cashflow_dists):
           self._add_snippet(dist)
-          vg_econ_uq.variables.append(samp_var.name)
           monte_carlo.add_variable(samp_var)
+        vg_econ_uq.variables.extend(samp_var.name for samp_var in cashflow_vars)
     else:
       monte_carlo = None
 
@@ -123,7 +127,7 @@ class DebugTemplate(RavenTemplate):
 
     # If we need both the MonteCarlo sampler and the CustomSampler, add them both to an EnsembleForward sampler so they
     # can be used together.
-    multirun_step = self._template.find("Steps/MultiRun[@name='debug']")
+    multirun_step = self._by_name[("MultiRun", "debug")]
     if monte_carlo and custom_sampler:
       ensemble_sampler = self._create_ensemble_forward_sampler([monte_carlo, custom_sampler], name="ensemble_sampler")
       self._add_snippet(ensemble_sampler)
@@ -138,7 +142,7 @@ class DebugTemplate(RavenTemplate):
       raise ValueError("Nothing that requires a sampler was found.")
 
     # Add the model and file inputs to the main multirun step
-    multirun = self._template.find("Steps/MultiRun[@name='debug']")
+    multirun = self._by_name[("MultiRun", "debug")]
     model = self._template.find("Models/EnsembleModel") or self._template.find("Models/ExternalModel")
     multirun.add_model(model)
     for func in self._get_function_files(sources):
@@ -184,11 +188,11 @@ class DebugTemplate(RavenTemplate):
     dispatcher_assemb = dispatcher.to_assembler_node("Model")
     # FIXME: I don't know why this is the case with RAVEN, but the dispatch_placeholder data object MUST come before
     # any function <Input> nodes, or it errors out. This is bad XML practice, which should be independent of order!
-    disp_placeholder = self._template.find("DataObjects/PointSet[@name='dispatch_placeholder']")
+    disp_placeholder = self._by_name[("PointSet", "dispatch_placeholder")]
     dispatcher_assemb.append(disp_placeholder.to_assembler_node("Input"))  # THIS COMES FIRST
-    for func in self._get_function_files(sources):
-      dispatcher_assemb.append(func.to_assembler_node("Input"))  # THEN ADD THESE
-    disp_eval = self._template.find("DataObjects/DataSet[@name='dispatch_eval']")
+    func_files = self._get_function_files(sources)
+    dispatcher_assemb.extend(func.to_assembler_node("Input") for func in func_files)  # THEN ADD THESE
+    disp_eval = self._by_name[("DataSet", "dispatch_eval")]
     dispatcher_assemb.append(disp_eval.to_assembler_node("TargetEvaluation"))
     ensemble.append(dispatcher_assemb)
 
@@ -204,36 +208,35 @@ class DebugTemplate(RavenTemplate):
     @ Out, None
     """
     # Fill out capacities vargroup
-    capacities_vargroup = self._template.find("VariableGroups/Group[@name='GRO_capacities']")
+    capacities_vargroup = self._by_name[("Group", "GRO_capacities")]
     capacities_vars = list(get_capacity_vars(components, self.namingTemplates["variable"], debug=True))
     capacities_vargroup.variables.extend(capacities_vars)
 
     # Add time indices to GRO_time_indices
-    self._template.find("VariableGroups/Group[@name='GRO_time_indices']").variables = [
+    self._by_name[("Group", "GRO_time_indices")].variables = [
       case.get_time_name(),
       case.get_year_name()
     ]
 
     # Dispatch variables
     dispatch_vars = get_component_activity_vars(components, self.namingTemplates["dispatch"])
-    self._template.find("VariableGroups/Group[@name='GRO_full_dispatch']").variables.extend(dispatch_vars)
+    self._by_name[("Group", "GRO_full_dispatch")].variables.extend(dispatch_vars)
 
     # Cashflows
     cfs = get_cashflow_names(components)
-    self._template.find("VariableGroups/Group[@name='GRO_cashflows']").variables.extend(cfs)
+    self._by_name[("Group", "GRO_cashflows")].variables.extend(cfs)
 
     # Time history sources
-    group = self._template.find("VariableGroups/Group[@name='GRO_debug_synthetics']")  # type: VariableGroup
-    for source in filter(lambda x: x.type in ["ARMA", "CSV"], sources):
-      synths = source.get_variable()
-      group.variables.extend(synths)
+    group = self._by_name[("Group", "GRO_debug_synthetics")]  # type: VariableGroup
+    synth_sources = filter(lambda x: x.type in ["ARMA", "CSV"], sources)
+    group.variables.extend(it.chain.from_iterable(source.get_variable() for source in synth_sources))
 
     # Figure out which econ metrics are being used for the case
     activity_vars = get_component_activity_vars(components, self.namingTemplates["tot_activity"])
     econ_vars = case.get_econ_metrics(nametype="output")
     output_vars = econ_vars + activity_vars
-    self._template.find("VariableGroups/Group[@name='GRO_dispatch_out']").variables.extend(output_vars)
-    self._template.find("VariableGroups/Group[@name='GRO_timeseries_out_scalar']").variables.extend(output_vars)
+    self._by_name[("Group", "GRO_dispatch_out")].variables.extend(output_vars)
+    self._by_name[("Group", "GRO_timeseries_out_scalar")].variables.extend(output_vars)
 
   def _update_dataset_indices(self, case: HeronCase) -> None:
     """
@@ -247,14 +250,11 @@ class DebugTemplate(RavenTemplate):
     year_name = case.get_year_name()
     cluster_name = self.namingTemplates["cluster_index"]
 
-    for time_index in self._template.findall(".//DataSet/Index[@var='Time']"):
-      time_index.set("var", time_name)
-
-    for year_index in self._template.findall(".//DataSet/Index[@var='Year']"):
-      year_index.set("var", year_name)
-
-    for cluster_index in self._template.findall(".//DataSet/Index[@var='_ROM_Cluster']"):
-      cluster_index.set("var", cluster_name)
+    # Rename the placeholder index variables in a single pass over the DataSet indices
+    index_names = {"Time": time_name, "Year": year_name, "_ROM_Cluster": cluster_name}
+    for index in self._template.iterfind(".//DataSet/Index"):
+      if (new_name := index_names.get(index.get("var"))) is not None:
+        index.set("var", new_name)
 
   def _make_dispatch_plot(self, case: HeronCase) -> HeronDispatchPlot:
     """
@@ -263,7 +263,7 @@ class DebugTemplate(RavenTemplate):
     @ Out, disp_plot, HeronDispatchPlot, the dispatch plot node
     """
     disp_plot = HeronDispatchPlot("dispatchPlot")
-    dispatch_dataset = self._template.find("DataObjects/DataSet[@name='dispatch']")
+    dispatch_dataset = self._by_name[("DataSet", "dispatch")]
     disp_plot.source = dispatch_dataset
     disp_plot.macro_variable = case.get_year_name()
     disp_plot.micro_variable = case.get_time_name()
@@ -277,6 +277,6 @@ class DebugTemplate(RavenTemplate):
     @ Out, cashflow_plot, TealCashFlowPlot, the cashflow plot node
     """
     cashflow_plot = TealCashFlowPlot("cashflow_plot")
-    cashflows = self._template.find("DataObjects/HistorySet[@name='cashflows']")
+    cashflows = self._by_name[("HistorySet", "cashflows")]
     cashflow_plot.source = cashflows
     return cashflow_plot
@@ -52,11 +52,11 @@ class FlatMultiConfigTemplate(RavenTemplate):
     self._initialize_runinfo(case)
 
     # Set up some helpful variable groups
-    capacities_vargroup = self._template.find("VariableGroups/Group[@name='GRO_capacities']")  # type: VariableGroup
+    capacities_vargroup = self._by_name[("Group", "GRO_capacities")]  # type: VariableGroup
     capacities_vars = list(get_capacity_vars(components, self.namingTemplates["variable"]))
     capacities_vargroup.variables.extend(capacities_vars)
 
-    results_vargroup = self._template.find("VariableGroups/Group[@name='GRO_results']")  # type: VariableGroup
+    results_vargroup = self._by_name[("Group", "GRO_results")]  # type: VariableGroup
     results_vars = self._get_deterministic_results_vars(case, components)
     results_vargroup.variables.extend(results_vars)
 
@@ -66,12 +66,12 @@ class FlatMultiConfigTemplate(RavenTemplate):
 
     # Define a grid sampler, a data object to store the sweep results, and an outstream to print those results
     grid_sampler = self._template.find("Samplers/EnsembleForward/Grid")  # type: Grid
-    grid_results = self._template.find("DataObjects/PointSet[@name='grid']")  # type: PointSet
+    grid_results = self._by_name[("PointSet", "grid")]  # type: PointSet
 
     variables, consts = self._create_sampler_variables(case, components)
-    for sampled_var, vals in variables.items():
+    for sampled_var, vals in variables:
       grid_sampler.add_variable(sampled_var)
-      sampled_var.use_grid(construction="custom", kind="value", values=sorted(vals))
+      sampled_var.use_grid(construction="custom", kind="value", values=vals)
 
     ensemble_sampler = self._template.find("Samplers/EnsembleForward")  # type: EnsembleForward
     for var_name, val in consts.items():
@@ -87,7 +87,7 @@ class FlatMultiConfigTemplate(RavenTemplate):
     self._add_labels_to_sampler(grid_sampler, labels)
 
     # Use a MultiRun to run to the model over the grid points
-    multirun = self._template.find("Steps/MultiRun[@name='sweep']")  # type: MultiRun
+    multirun = self._by_name[("MultiRun", "sweep")]  # type: MultiRun
     for func in self._get_function_files(sources):
       multirun.add_input(func)
 
@@ -6,13 +6,15 @@
   @author: Jacob Bryan (@j-bryan)
   @date: 2024-12-23
 """
-import itertools
 from dataclasses import dataclass
 from typing import Any
 import xml.etree.ElementTree as ET
 
 from .heron_types import HeronCase, Component
 
+# Capacity ValuedParam types which limit capacity through a signal or function that is handled in the dispatch
+_DISPATCH_LIMITED_CAP_TYPES = frozenset({"StaticHistory", "SyntheticHistory", "Function", "Variable"})
+
 
 @dataclass(frozen=True)
 class Statistic:
@@ -25,16 +27,23 @@ class Statistic:
   threshold : str | None = None
   percent: str | None = None
 
+  @property
+  def metric_prefix(self) -> str:
+    """
+    Get the part of the statistic name which comes before the variable name
+    @ In, None
+    @ Out, metric_prefix, str, the statistic prefix, including any threshold or percent (e.g. percentile_5)
+    """
+    param = self.threshold or self.percent  # threshold, percent, or None
+    return f"{self.prefix}_{param}" if param else self.prefix
+
   def to_metric(self, variable: str) -> str:
     """
     Get the name for this statistic of variable
     @ In, variable, str, the variable name (e.g. NPV)
     @ Out, varname, str, the name of a variable's statistic (e.g. mean_NPV)
     """
-    param = self.threshold or self.percent  # threshold, percent, or None
-    parts = [self.prefix, param, variable] if param else [self.prefix, variable]
-    varname = "_".join(parts)
-    return varname
+    return self.metric_prefix + "_" + variable
 
   def to_element(self, variable: str) -> ET.Element:
     """
@@ -62,29 +71,26 @@ def get_statistics(stat_names: list[str], stat_meta: dict) -> list[Statistic]:
   for name in stat_names:
     meta = stat_meta[name]
     prefix = meta["prefix"]
-    percent = meta.get("percent", None)
-    if not isinstance(percent, list):
-      percent = [percent]
-    threshold = meta.get("threshold", None)
-    if not isinstance(threshold, list):
-      threshold = [threshold]
-
-    for perc, thresh in itertools.product(percent, threshold):
-      new_stat = Statistic(name=name, prefix=prefix, threshold=thresh, percent=perc)
-      stats.append(new_stat)
+    # Either parameter may be a single value (possibly None) or a list of values
+    percent = meta.get("percent")
+    percents = percent if isinstance(percent, list) else (percent,)
+    threshold = meta.get("threshold")
+    thresholds = threshold if isinstance(threshold, list) else (threshold,)
+    stats.extend(Statistic(name=name, prefix=prefix, threshold=thresh, percent=perc)
+                 for perc in percents for thresh in thresholds)
 
   return stats
 
-def get_result_stats(names: list[str], stats: list[str], case: HeronCase) -> list[str]:
+def get_stat_metric_names(names: list[str], stats: list[Statistic]) -> list[str]:
   """
-    Constructs the names of the statistics requested for output
+    Constructs the names of the given statistics of the result metrics
     @ In, names, list[str], result metric names (economics, component activities)
-    @ In, stats, list[str], statistic names
-    @ In, case, HeronCase, defining Case instance
+    @ In, stats, list[Statistic], Statistic objects for each statistic of interest
     @ Out, names, list[str], list of names of statistics requested for output
   """
-  stats_objs = get_statistics(stats, case.stats_metrics_meta)
-  stat_names = [stat.to_metric(name) for stat, name in itertools.product(stats_objs, names)]
+  # The statistic prefix doesn't depend on the metric name, so build each one once up front
+  prefixes = [stat.metric_prefix for stat in stats]
+  stat_names = [prefix + "_" + name for prefix in prefixes for name in names]
   return stat_names
 
 def get_capacity_vars(components: list[Component], name_template, *, debug=False) -> dict[str, Any]:
@@ -111,7 +117,7 @@ def get_capacity_vars(components: list[Component], name_template, *, debug=False
       cap_name = name_template.format(unit=name, feature='capacity')
       values = capacity.get_value(debug=debug)
       variables[cap_name] = values
-    elif capacity.type in ['StaticHistory', 'SyntheticHistory', 'Function', 'Variable']:
+    elif capacity.type in _DISPATCH_LIMITED_CAP_TYPES:
       # capacity is limited by a signal, so it has to be handled in the dispatch; don't include it here.
       # OR capacity is limited by a function, and we also can't handle it here, but in the dispatch.
       pass
@@ -129,17 +135,30 @@ def get_component_activity_vars(components: list[Component], name_template: str)
   @ Out, variables, list[str], list of variable names
   """
   variables = []
+  name_fmt = name_template.format
 
   for component in components:
     name = component.name
+    # Resources don't depend on the tracker, so only sort them once per component
+    resource_list = sorted(component.get_resources())
     for tracker in component.get_tracking_vars():
-      resource_list = sorted(list(component.get_resources()))
-      for resource in resource_list:
-        var_name = name_template.format(component=name, tracker=tracker, resource=resource)
-        variables.append(var_name)
+      variables.extend(name_fmt(component=name, tracker=tracker, resource=resource) for resource in resource_list)
 
   return variables
 
+def get_opt_statistic(case: HeronCase) -> str:
+  """
+  Get the name of the statistic used for the optimization objective
+  @ In, case, HeronCase, the HERON case object
+  @ Out, statistic, str, the name of the statistic
+  """
+  opt_settings = case.get_optimization_settings() or {}
+  stats_metric = opt_settings.get("stats_metric")
+  if isinstance(stats_metric, dict) and "name" in stats_metric:
+    return stats_metric["name"]
+  # FIXME: What about cases with only 1 history (not statistical)?
+  return "expectedValue"  # default to expectedValue
+
 def get_opt_objective(case: HeronCase) -> str:
   """
   Get the name of the optimization objective
@@ -147,13 +166,7 @@ def get_opt_objective(case: HeronCase) -> str:
   @ Out, objective, str, the name of the objective
   """
   # What statistic is used for the objective?
-  opt_settings = case.get_optimization_settings()
-  try:
-    statistic = opt_settings["stats_metric"]["name"]
-  except (KeyError, TypeError):
-    # FIXME: What about cases with only 1 history (not statistical)?
-    statistic = "expectedValue"  # default to expectedValue
-
+  statistic = get_opt_statistic(case)
   meta = case.stats_metrics_meta[statistic]
   stat_name = meta["prefix"]
   param = meta.get("percent", None) or meta.get("threshold", None)
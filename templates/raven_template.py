@@ -11,12 +11,14 @@ import re
 import glob
 from pathlib import Path
 import itertools as it
+from typing import Iterable
 import xml.etree.ElementTree as ET
 
 from .imports import xmlUtils, Template
 from .heron_types import HeronCase, Component, Source, ValuedParam
-from .naming_utils import get_result_stats, get_component_activity_vars, get_opt_objective, get_statistics, Statistic
-from .xml_utils import add_node_to_tree, stringify_node_values
+from .naming_utils import (get_component_activity_vars, get_opt_objective, get_opt_statistic, get_stat_metric_names,
+                           get_statistics, Statistic)
+from .xml_utils import add_node_to_tree, find_node, stringify_node_values, write_pretty
 
 from .snippets.base import RavenSnippet
 from .snippets.runinfo import RunInfo
@@ -33,30 +35,44 @@ from .snippets.factory import factory as snippet_factory
 
 
 # NOTE: Leave this here! Moving this to xml_utils.py will cause a circular import problem with snippets.factory.py
-def parse_to_snippets(node: ET.Element) -> ET.Element:
+def parse_to_snippets(node: ET.Element, release_source: bool = False) -> ET.Element:
   """
   Builds an XML tree that looks exactly like node but with RavenSnippet objects where defined.
   @ In, node, ET.Element, the node to parse
+  @ In, release_source, bool, optional, if True, each node of the source tree is cleared once it has been parsed so
+                                        the source tree isn't held in memory alongside the parsed tree
   @ Out, parsed: ET.Element, the parsed XML node
   """
-  # Base case: The node matches a registered RavenSnippet class. RavenSnippets know how to represent
-  # their entire contiguous block of XML, so no further recursion is necessary once a valid RavenSnippet
-  # is found.
-  if snippet_factory.has_registered_class(node):
-    snippet = snippet_factory.from_xml(node)
-    return snippet
-
-  # If the node doesn't match a registered RavenSnippet class, copy over the node to the
-  parsed = ET.Element(node.tag, node.attrib)
-  parsed.text = node.text
-  parsed.tail = node.tail
+  from_xml_or_none = snippet_factory.from_xml_or_none
+
+  # The tree is walked depth-first with an explicit stack of (source node, parsed parent) pairs instead of recursing
+  # over the node children. Each parsed node is appended to its parent as soon as it is created, and children are
+  # pushed in reverse so they are popped (and appended) in document order.
+  root = None
+  stack = [(node, None)]
+  while stack:
+    src, parent = stack.pop()
+    # RavenSnippets know how to represent their entire contiguous block of XML, so the subtree below a node matching
+    # a registered RavenSnippet class is never walked.
+    snippet = from_xml_or_none(src)
+    if snippet is None:
+      # If the node doesn't match a registered RavenSnippet class, copy over the node to the parsed tree
+      snippet = ET.Element(src.tag, src.attrib)
+      snippet.text = src.text
+      snippet.tail = src.tail
+      stack.extend((child, snippet) for child in reversed(src))
+
+    if parent is None:
+      root = snippet
+    else:
+      parent.append(snippet)
 
-  # Recurse over node children (if any)
-  for child in node:
-    parsed_child = parse_to_snippets(child)
-    parsed.append(parsed_child)
+    # Clearing the source node only drops its own references. Any source children adopted by the parsed tree (some
+    # snippet classes append unmodified subnodes) or still waiting on the stack are unaffected.
+    if release_source:
+      src.clear()
 
-  return parsed
+  return root
 
 class RavenTemplate(Template):
   """ Template class for RAVEN workflows """
@@ -69,6 +85,7 @@ class RavenTemplate(Template):
   # Prefixes for financial metrics only
   FINANCIAL_PREFIXES = ["sharpe", "sortino", "es", "VaR", "glr"]
   FINANCIAL_STATS_NAMES = ["sharpeRatio", "sortinoRatio", "expectedShortfall", "valueAtRisk", "gainLossRatio"]
+  FINANCIAL_STATS_NAMES_SET = frozenset(FINANCIAL_STATS_NAMES)  # for fast membership checks
 
   def __init__(self) -> None:
     """
@@ -94,6 +111,8 @@ class RavenTemplate(Template):
                              "statistic"      : "{prefix}_{name}"
                              })
     self._template = None
+    self._opt_objective = None  # str | None, name of the optimization objective variable, once it's been found
+    self._by_name = {}  # dict[tuple[str, str], RavenSnippet], named entity nodes keyed by (tag, name)
 
   ########################
   # PUBLIC API FUNCTIONS #
@@ -107,7 +126,14 @@ class RavenTemplate(Template):
       @ Out, None
     """
     super().loadTemplate(filename, path)
-    self._template = parse_to_snippets(self._template)
+    # The template as loaded from file isn't used after it's parsed to snippets, so release it as we go
+    self._template = parse_to_snippets(self._template, release_source=True)
+    # Entities (variable groups, data objects, steps, etc.) are looked up by name throughout the workflow build, so
+    # index them once here instead of searching the tree for each lookup
+    self._by_name = {}
+    for entity_class in self._template:
+      for node in entity_class:
+        self._register_named_node(node)
 
   def createWorkflow(self, **kwargs) -> None:
     """
@@ -117,6 +143,7 @@ class RavenTemplate(Template):
     """
     # Universal workflow settings
     self._set_verbosity(kwargs["case"].get_verbosity())
+    self._opt_objective = None
 
   def writeWorkflow(self, template: ET.Element, destination: str, run: bool = False) -> None:
     """
@@ -126,19 +153,26 @@ class RavenTemplate(Template):
       @ In, run, bool, optional, if True then run the workflow after writing? good idea?
       @ Out, errors, int, 0 if successfully wrote [and run] and nonzero if there was a problem
     """
-    # Ensure all node attribute values and text are expressed as strings. Errors are thrown if any of these aren't
-    # strings. Enforcing this here allows flexibility with how node values are stored and manipulated before write
-    # time, such as storing values as lists or numeric types. For example, text fields which are a comma-separated
-    # list of values can be stored in the RavenSnippet object as a list, and new items can be inserted into that
-    # list as needed, then the list can be converted to a string only now at write time.
-    stringify_node_values(template)
-
     # Remove any unused top-level nodes (Models, Samplers, etc.) to keep things looking clean
     for node in template:
       if len(node) == 0:
         template.remove(node)
 
-    super().writeWorkflow(template, destination, run)
+    # All node attribute values and text must be expressed as strings when written. Enforcing this only at write time
+    # allows flexibility with how node values are stored and manipulated before then, such as storing values as lists
+    # or numeric types. For example, text fields which are a comma-separated list of values can be stored in the
+    # RavenSnippet object as a list, and new items can be inserted into that list as needed, then the list can be
+    # converted to a string only now at write time.
+    if run:
+      # The RAVEN template writer also handles running the workflow. It writes the file itself (with RAVEN's prettify)
+      # before running it, so the file written on this path is formatted by RAVEN rather than write_pretty. No HERON
+      # caller writes with run=True; the write_pretty path below is the one used to produce workflow files.
+      stringify_node_values(template)
+      super().writeWorkflow(template, destination, run)
+    else:
+      # Values are converted to strings as the tree is streamed to file, so the tree is only traversed once
+      with open(destination, "w") as f:
+        write_pretty(template, f)
     print(f"Wrote '{self.write_name}' to '{destination}'")
 
   @property
@@ -172,13 +206,8 @@ class RavenTemplate(Template):
     @ In, parent, str | ET.Element | None, the parent node to add the snippet
     @ Out, None
     """
-    if isinstance(snippet, ET.Element) and not isinstance(snippet, RavenSnippet):
-      raise TypeError(f"The XML block to be added is not a RavenSnippet object. Received type: {type(snippet)}. "
-                      "Perhaps something went wrong when parsing the template XML, and the correct RavenSnippet "
-                      "subclass wasn't found?")
-    if snippet is None:
-      raise ValueError("Received None instead of a RavenSnippet object. Perhaps something went wrong when finding "
-                       "an XML node?")
+    self._check_snippet(snippet)
+    self._register_named_node(snippet)
 
     # If a parent node was provided, just append the snippet to its parent node.
     if isinstance(parent, ET.Element):
@@ -200,6 +229,51 @@ class RavenTemplate(Template):
     # Steps, etc.) exist without having to add a check everywhere a snippet needs to get added.
     add_node_to_tree(snippet, parent_path, self._template)
 
+  def _add_snippets(self, snippets: Iterable[RavenSnippet]) -> None:
+    """
+    Add several XML snippets to the template XML at once. Snippets are grouped by their snippet class so that each
+    parent node (Models, DataObjects, Steps, etc.) is found or created only once.
+    @ In, snippets, Iterable[RavenSnippet], the XML snippets to add
+    @ Out, None
+    """
+    # Group the snippets by parent node path. Dicts preserve insertion order, so the order of the snippets within
+    # each parent node is the same as if they had been added one at a time.
+    groups = {}
+    for snippet in snippets:
+      self._check_snippet(snippet)
+      self._register_named_node(snippet)
+      if snippet.snippet_class is None:
+        raise ValueError(f"The path to a parent node for node {snippet} could not be determined!")
+      groups.setdefault(snippet.snippet_class, []).append(snippet)
+
+    for parent_path, group in groups.items():
+      find_node(self._template, parent_path).extend(group)
+
+  def _register_named_node(self, node: ET.Element) -> None:
+    """
+    Add a named entity node to the (tag, name) lookup. Like ElementTree's find, the first node added with a given tag
+    and name is the one that is found.
+    @ In, node, ET.Element, the node being added to the template
+    @ Out, None
+    """
+    if (name := node.get("name")) is not None:
+      self._by_name.setdefault((node.tag, name), node)
+
+  @staticmethod
+  def _check_snippet(snippet: RavenSnippet) -> None:
+    """
+    Check that an object to be added to the template XML is a RavenSnippet
+    @ In, snippet, RavenSnippet, the object to check
+    @ Out, None
+    """
+    if isinstance(snippet, ET.Element) and not isinstance(snippet, RavenSnippet):
+      raise TypeError(f"The XML block to be added is not a RavenSnippet object. Received type: {type(snippet)}. "
+                      "Perhaps something went wrong when parsing the template XML, and the correct RavenSnippet "
+                      "subclass wasn't found?")
+    if snippet is None:
+      raise ValueError("Received None instead of a RavenSnippet object. Perhaps something went wrong when finding "
+                       "an XML node?")
+
   ##############################
   # FEATURE BUILDING UTILITIES #
   ##############################
@@ -207,6 +281,16 @@ class RavenTemplate(Template):
   # RAVEN template they modify.
 
   # Global attributes
+  def _get_opt_objective(self, case: HeronCase) -> str:
+    """
+    Get the name of the optimization objective, which is only worked out from the case settings once per workflow
+    @ In, case, HeronCase, the HERON case
+    @ Out, objective, str, the name of the objective
+    """
+    if self._opt_objective is None:
+      self._opt_objective = get_opt_objective(case)
+    return self._opt_objective
+
   def _set_verbosity(self, verbosity: str) -> None:
     """
     Sets the verbosity attribute of the root Simulation node
@@ -300,7 +384,7 @@ class RavenTemplate(Template):
     if source.limit_interp is not None:
       rom.add_subelements(maxCycles=source.limit_interp)
     if source.eval_mode == 'clustered':
-      ET.SubElement(rom, "clusterEvalMode").text = "clustered"
+      rom.add_subelements(clusterEvalMode="clustered")
 
     # Create an IOStep to load the ROM from the file
     step = IOStep(f"read_{source.name}")
@@ -348,6 +432,22 @@ class RavenTemplate(Template):
     group.variables.extend(map(lambda label: f"{label}_label", labels.keys()))
     return group
 
+  def _get_stats_names(self, case: HeronCase) -> list[str]:
+    """
+    Get the names of the statistics to calculate for the economic metrics: the defaults for the case mode, followed by
+    any additional result statistics requested for the case
+    @ In, case, HeronCase, the HERON case
+    @ Out, stats_names, list[str], the statistic names
+    """
+    default_names = self.DEFAULT_STATS_NAMES.get(case.get_mode(), [])
+    result_stats = case.get_result_statistics()
+    if not result_stats:
+      return list(default_names)
+    # This gets the unique values from default_names and the case result statistics dict keys. Set operations
+    # look cleaner but result in a randomly ordered list. Having a consistent ordering of statistics is beneficial
+    # from a UX standpoint.
+    return list(dict.fromkeys(it.chain(default_names, result_stats)))
+
   def _get_statistical_results_vars(self, case: HeronCase, components: list[Component]) -> list[str]:
     """
     Collects result metric names for statistical metrics. Should only be used with templates which have multiple
@@ -357,23 +457,21 @@ class RavenTemplate(Template):
     @ Out, var_names, list[str], list of variable names
     """
     # Add statistics for economic metrics to variable group. Use all statistics.
-    default_names = self.DEFAULT_STATS_NAMES.get(case.get_mode(), [])
-    # This gets the unique values from default_names and the case result statistics dict keys. Set operations
-    # look cleaner but result in a randomly ordered list. Having a consistent ordering of statistics is beneficial
-    # from a UX standpoint.
-    stats_names = list(dict.fromkeys(default_names + list(case.get_result_statistics())))
+    stats_names = self._get_stats_names(case)
     econ_metrics = case.get_econ_metrics(nametype="output")
-    stats_var_names = get_result_stats(econ_metrics, stats_names, case)
+    econ_stats = get_statistics(stats_names, case.stats_metrics_meta)
+    stats_var_names = get_stat_metric_names(econ_metrics, econ_stats)
 
-    # Add total activity statistics for variable group. Use only non-financial statistics.
-    non_fin_stat_names = [name for name in stats_names if name not in self.FINANCIAL_STATS_NAMES]
+    # Add total activity statistics for variable group. Use only non-financial statistics, which are a subset of the
+    # statistics already expanded above.
+    activity_stats = [stat for stat in econ_stats if stat.name not in self.FINANCIAL_STATS_NAMES_SET]
     tot_activity_metrics = get_component_activity_vars(components, self.namingTemplates["tot_activity"])
-    activity_var_names = get_result_stats(tot_activity_metrics, non_fin_stat_names, case)
+    activity_var_names = get_stat_metric_names(tot_activity_metrics, activity_stats)
 
     var_names = stats_var_names + activity_var_names
 
     # The optimization objective might not have made it into the list. Make sure it's there.
-    if case.get_mode() == "opt" and (objective := get_opt_objective(case)) not in var_names:
+    if case.get_mode() == "opt" and (objective := self._get_opt_objective(case)) not in var_names:
       var_names.insert(0, objective)
 
     return var_names
@@ -396,16 +494,15 @@ class RavenTemplate(Template):
     @ In, components, list[Component], HERON components
     @ Out, act_metrics, list[str], component activity metric names
     """
+    # NOTE: Assumes the only activity metric we care about is total activity
+    tot_activity_fmt = self.namingTemplates["tot_activity"].format
     act_metrics = []
     for component in components:
-      for tracker in component.get_tracking_vars():
-        resource_list = sorted(list(component.get_resources()))
-        for resource in resource_list:
-          # NOTE: Assumes the only activity metric we care about is total activity
-          default_stats_tot_activity = self.namingTemplates["tot_activity"].format(component=component.name,
-                                                                                   tracker=tracker,
-                                                                                   resource=resource)
-          act_metrics.append(default_stats_tot_activity)
+      # Resources don't depend on the tracker, so only sort them once per component
+      resource_list = sorted(component.get_resources())
+      act_metrics.extend([tot_activity_fmt(component=component.name, tracker=tracker, resource=resource)
+                          for tracker in component.get_tracking_vars()
+                          for resource in resource_list])
     return act_metrics
 
   # Models
@@ -416,41 +513,42 @@ class RavenTemplate(Template):
     @ In, sources, list[Source], case sources
     @ Out, None
     """
-    dispatch_eval = self._template.find("DataObjects/DataSet[@name='dispatch_eval']")  # type: DataSet
+    dispatch_eval = self._by_name[("DataSet", "dispatch_eval")]  # type: DataSet
+    data_object_fmt = self.namingTemplates["data object"].format
+    cluster_index = self.namingTemplates["cluster_index"]
 
     # Gather any ARMA sources from the list of sources
     arma_sources = [s for s in sources if s.is_type("ARMA")]
 
     # Add cluster index info to dispatch variable groups and data objects
     if any(source.eval_mode == "clustered" for source in arma_sources):
-      vg_dispatch = self._template.find("VariableGroups/Group[@name='GRO_dispatch']")  # type: VariableGroup
-      vg_dispatch.variables.append(self.namingTemplates["cluster_index"])
-      dispatch_eval.add_index(self.namingTemplates["cluster_index"], "GRO_dispatch_in_Time")
-
-    # Add models, steps, and their requisite data objects and outstreams for each case source
+      vg_dispatch = self._by_name[("Group", "GRO_dispatch")]  # type: VariableGroup
+      vg_dispatch.variables.append(cluster_index)
+      dispatch_eval.add_index(cluster_index, "GRO_dispatch_in_Time")
+
+    # Add models, steps, and their requisite data objects and outstreams for each case source. The snippets are
+    # collected and added to the template all at once after the loop.
+    new_snippets = []
+    rom_out_vars = []
     for source in arma_sources:
       # An ARMA source is a pickled ROM that needs to be loaded.
       # Load the ROM from file
       source_file, pickled_rom, load_iostep = self._load_pickled_rom(source)
-      self._add_snippet(source_file)
-      self._add_snippet(pickled_rom)
-      self._add_snippet(load_iostep)
+      new_snippets.extend([source_file, pickled_rom, load_iostep])
       self._add_step_to_sequence(load_iostep, index=0)
 
       # Print the pickled ROM metadata
       meta_dataset, meta_outstream, meta_iostep = self._print_rom_meta(pickled_rom)
-      self._add_snippet(meta_dataset)
-      self._add_snippet(meta_outstream)
-      self._add_snippet(meta_iostep)
+      new_snippets.extend([meta_dataset, meta_outstream, meta_iostep])
       self._add_step_to_sequence(meta_iostep, index=1)
 
       # Add loaded ROM to the EnsembleModel
-      inp_name = self.namingTemplates["data object"].format(source=source.name, contents="placeholder")
+      inp_name = data_object_fmt(source=source.name, contents="placeholder")
       inp_do = PointSet(inp_name)
       inp_do.inputs.append("scaling")
-      self._add_snippet(inp_do)
+      new_snippets.append(inp_do)
 
-      eval_name = self.namingTemplates["data object"].format(source=source.name, contents="samples")
+      eval_name = data_object_fmt(source=source.name, contents="samples")
       eval_do = DataSet(eval_name)
       eval_do.inputs.append("scaling")
       out_vars = source.get_variable()
@@ -458,16 +556,18 @@ class RavenTemplate(Template):
       eval_do.add_index(case.get_time_name(), out_vars)
       eval_do.add_index(case.get_year_name(), out_vars)
       if source.eval_mode == "clustered":
-        eval_do.add_index(self.namingTemplates["cluster_index"], out_vars)
-      self._add_snippet(eval_do)
+        eval_do.add_index(cluster_index, out_vars)
+      new_snippets.append(eval_do)
 
       rom_assemb = pickled_rom.to_assembler_node("Model")
       rom_assemb.append(inp_do.to_assembler_node("Input"))
       rom_assemb.append(eval_do.to_assembler_node("TargetEvaluation"))
       ensemble_model.append(rom_assemb)
+      rom_out_vars.extend(out_vars)
 
-      # update variable group with ROM output variable names
-      self._template.find("VariableGroups/Group[@name='GRO_dispatch_in_Time']").variables.extend(out_vars)
+    # update variable group with ROM output variable names
+    self._by_name[("Group", "GRO_dispatch_in_Time")].variables.extend(rom_out_vars)
+    self._add_snippets(new_snippets)
 
   def _get_stats_for_econ_postprocessor(self,
                                         case: HeronCase,
@@ -485,12 +585,10 @@ class RavenTemplate(Template):
     # names, prefixes, and variable name separate here, not as one big string. Otherwise, we have to try to break that
     # string back up, which would be sensitive to metric and variable naming conventions. We duplicate a little of the
     # logic but get something more robust in return.
-    default_names = self.DEFAULT_STATS_NAMES.get(case.get_mode(), [])
-    stats_names = list(dict.fromkeys(default_names + list(case.get_result_statistics())))
+    stats_names = self._get_stats_names(case)
     econ_stats = get_statistics(stats_names, case.stats_metrics_meta)
     # Activity metrics with non-financial statistics
-    non_fin_stat_names = [name for name in stats_names if name not in self.FINANCIAL_STATS_NAMES]
-    activity_stats = get_statistics(non_fin_stat_names, case.stats_metrics_meta)
+    activity_stats = [stat for stat in econ_stats if stat.name not in self.FINANCIAL_STATS_NAMES_SET]
 
     # Collect the statistics to add to the postprocessor
     stats_to_add = list(it.chain(
@@ -500,12 +598,7 @@ class RavenTemplate(Template):
 
     # The metric needed for the objective function might not have been added yet.
     if case.get_mode() == "opt":
-      opt_settings = case.get_optimization_settings()
-      try:
-        statistic = opt_settings["stats_metric"]["name"]
-      except (KeyError, TypeError):
-        statistic = "expectedValue"  # default to expectedValue
-      opt_stat = get_statistics([statistic], case.stats_metrics_meta)[0]
+      opt_stat = get_statistics([get_opt_statistic(case)], case.stats_metrics_meta)[0]
       target_var, _ = case.get_opt_metric()
       target_var_output_name = case.economic_metrics_meta[target_var]["output_name"]
       if (opt_stat, target_var_output_name) not in stats_to_add:
@@ -514,20 +607,23 @@ class RavenTemplate(Template):
     return stats_to_add
 
   # Distributions and SampledVariables
-  def _create_new_sampled_capacity(self, var_name: str, capacities: list[float]) -> SampledVariable:
+  def _create_new_sampled_capacity(self,
+                                   var_name: str,
+                                   capacities: list[float],
+                                   distributions: ET.Element | None = None) -> SampledVariable:
     """
     Creates a uniform distribution and SampledVariable object for a given list of capacities
     @ In, var_name, str, name of the variable
-    @ In, capacities, list[float], list of capacity values
+    @ In, capacities, list[float], list of capacity values, sorted in ascending order
+    @ In, distributions, ET.Element, optional, the already located <Distributions> node to add the distribution to
     @ Out, sampled_var, SampledVariable, variable to be sampled
     """
     dist_name = self.namingTemplates["distribution"].format(variable=var_name)
     dist = Uniform(dist_name)
-    min_cap = min(capacities)
-    max_cap = max(capacities)
-    dist.lower_bound = min_cap
-    dist.upper_bound = max_cap
-    self._add_snippet(dist)
+    # The capacities are sorted, so the bounds are just the end points
+    dist.lower_bound = capacities[0]
+    dist.upper_bound = capacities[-1]
+    self._add_snippet(dist, distributions)
 
     sampled_var = SampledVariable(var_name)
     sampled_var.distribution = dist
@@ -544,6 +640,8 @@ class RavenTemplate(Template):
     """
     sampled_vars = []
     distributions = []
+    variable_fmt = self.namingTemplates["variable"].format
+    distribution_fmt = self.namingTemplates["distribution"].format
 
     # For each component, cashflow, and cashflow equation parameter, find any which are uncertain, and create
     # distribution and sampled variable objects.
@@ -551,8 +649,8 @@ class RavenTemplate(Template):
       for cashflow in component.get_cashflows():
         for param_name, vp in cashflow.get_uncertain_params().items():
           unit_name = f"{component.name}_{cashflow.name}"
-          feat_name = self.namingTemplates["variable"].format(unit=unit_name, feature=param_name)
-          dist_name = self.namingTemplates["distribution"].format(variable=feat_name)
+          feat_name = variable_fmt(unit=unit_name, feature=param_name)
+          dist_name = distribution_fmt(variable=feat_name)
 
           # Reconstruct distribution XML node from valuedParam definition
           dist_node = vp._vp.get_distribution()  # type: ET.Element
@@ -570,45 +668,54 @@ class RavenTemplate(Template):
   # Samplers
   def _create_sampler_variables(self,
                                 case: HeronCase,
-                                components: list[Component]) -> tuple[dict[SampledVariable, list[float]],
+                                components: list[Component]) -> tuple[list[tuple[SampledVariable, list[float]]],
                                                                       dict[str, ValuedParam]]:
     """
     Create the Distribution and SampledVariable objects and the list of constant capacities that need to
     be added to samplers and optimizers.
     @ In, case, Case, HERON case
     @ In, components, list[Component], HERON components
-    @ Out, sampled_variables, dict[SampledVariable, list[float]], variable objects for the sampler/optimizer
+    @ Out, sampled_variables, list[tuple[SampledVariable, list[float]]], variable objects for the
+                                                                       sampler/optimizer paired with their values,
+                                                                       sorted in ascending order
     @ Out, constants, dict[str, float], constant variables
     """
-    sampled_variables = {}
+    sampled_variables = []
     constants = {}
+    to_sample = []  # (variable name, values) pairs which need a distribution and SampledVariable
+    variable_fmt = self.namingTemplates["variable"].format
 
-    # Make Distribution and SampledVariable objects for sampling dispatch variables
+    # Sample any dispatch variables with multiple values
     for key, value in case.dispatch_vars.items():
-      var_name = self.namingTemplates["variable"].format(unit=key, feature="dispatch")
+      var_name = variable_fmt(unit=key, feature="dispatch")
       vals = value.get_value(debug=case.debug["enabled"])
       if isinstance(vals, list):
-        sampled_var = self._create_new_sampled_capacity(var_name, vals)
-        sampled_variables[sampled_var] = vals
+        to_sample.append((var_name, sorted(vals)))
 
-    # Make Distribution and SampledVariable objects for capacity variables. Capacities with non-parametric
-    # ValuedParams are fixed values and are added instead as constants.
+    # Sample capacity variables with multiple values. Capacities with non-parametric ValuedParams are fixed values and
+    # are added instead as constants.
     for component in components:
-      interaction = component.get_interaction()
       name = component.name
-      var_name = self.namingTemplates["variable"].format(unit=name, feature="capacity")
-      cap = interaction.get_capacity(None, raw=True)  # type: ValuedParam
+      var_name = variable_fmt(unit=name, feature="capacity")
+      cap = component.get_capacity(None, raw=True)
 
       if not cap.is_parametric():  # we already know the value
         continue
 
       vals = cap.get_value(debug=case.debug["enabled"])
       if isinstance(vals, list):  # multiple values meaning either opt bounds or sweep values
-        sampled_var = self._create_new_sampled_capacity(var_name, vals)
-        sampled_variables[sampled_var] = vals
+        to_sample.append((var_name, sorted(vals)))
       else:  # just one value meaning it's a constant
         constants[var_name] = vals
 
+    # Make Distribution and SampledVariable objects for the sampled variables. The <Distributions> node is only looked
+    # up (or created) once, and only if there's something to put in it.
+    if to_sample:
+      distributions = find_node(self._template, Distribution.snippet_class)
+      for var_name, vals in to_sample:
+        sampled_var = self._create_new_sampled_capacity(var_name, vals, distributions)
+        sampled_variables.append((sampled_var, vals))
+
     return sampled_variables, constants
 
   def _add_labels_to_sampler(self, sampler: Sampler, labels: dict[str, str]) -> None:
@@ -618,8 +725,9 @@ class RavenTemplate(Template):
     @ In, case, Case, HERON case
     @ Out, None
     """
+    variable_fmt = self.namingTemplates["variable"].format
     for key, value in labels.items():
-      var_name = self.namingTemplates["variable"].format(unit=key, feature="label")
+      var_name = variable_fmt(unit=key, feature="label")
       sampler.add_constant(var_name, value)
 
   def _configure_static_history_sampler(self,
@@ -640,12 +748,12 @@ class RavenTemplate(Template):
     if case.debug["enabled"]:
       indices.append(cluster_index)
 
-    time_series_vargroup = self._template.find("VariableGroups/Group[@name='GRO_timeseries']")  # type: VariableGroup
+    time_series_vargroup = self._by_name[("Group", "GRO_timeseries")]  # type: VariableGroup
 
     for source in filter(lambda x: x.is_type("CSV"), sources):
       # Add the source variables to the GRO_timeseries_in variable group
       source_vars = source.get_variable()
-      self._template.find("VariableGroups/Group[@name='GRO_timeseries']").variables.extend(source_vars)
+      self._by_name[("Group", "GRO_timeseries")].variables.extend(source_vars)
 
       # Create a new <DataObject> that will store the csv data
       csv_dataset = DataSet(source.name)
@@ -708,9 +816,9 @@ class RavenTemplate(Template):
     # Define grid sampler and build the variables and their distributions that it'll sample
     sampler = Grid("grid")
     variables, consts = self._create_sampler_variables(case, components)
-    for sampled_var, vals in variables.items():
+    for sampled_var, vals in variables:
       sampler.add_variable(sampled_var)
-      sampled_var.use_grid(construction="custom", kind="value", values=sorted(vals))
+      sampled_var.use_grid(construction="custom", kind="value", values=vals)
     for var_name, val in consts.items():
       sampler.add_constant(var_name, val)
 
@@ -755,9 +863,7 @@ class RavenTemplate(Template):
     gpr = GaussianProcessRegressor("gpROM")
 
     # Add blocks to XML template
-    self._add_snippet(optimizer)
-    self._add_snippet(sampler)
-    self._add_snippet(gpr)
+    self._add_snippets([optimizer, sampler, gpr])
 
     # Connect optimizer to sampler and ROM components
     optimizer.set_sampler(sampler)
@@ -772,7 +878,7 @@ class RavenTemplate(Template):
 
     # Create sampler variables and their respective distributions
     variables, consts = self._create_sampler_variables(case, components)
-    for sampled_var in variables:
+    for sampled_var, _ in variables:
       sampled_var.use_grid(construction="equal", kind="CDF", steps=4, values=[0, 1])
       optimizer.add_variable(sampled_var)
       sampler.add_variable(sampled_var)
@@ -782,14 +888,13 @@ class RavenTemplate(Template):
     # Set number of denoises
     optimizer.denoises = case.get_num_samples()
 
-    # Set GPR features list and target
-    for component in components:
-      name = component.name
-      interaction = component.get_interaction()
-      cap = interaction.get_capacity(None, raw=True)
-      if cap.is_parametric() and isinstance(cap.get_value(debug=case.debug["enabled"]) , list):
-        gpr.features.append(self.namingTemplates["variable"].format(unit=name, feature="capacity"))
-    gpr.target.append(get_opt_objective(case))
+    # Set GPR features list and target. The features are the sampled capacities, which were already found above, so
+    # the capacity values don't need to be evaluated again.
+    sampled_names = {sampled_var.name for sampled_var, _ in variables}
+    variable_fmt = self.namingTemplates["variable"].format
+    cap_names = (variable_fmt(unit=component.name, feature="capacity") for component in components)
+    gpr.features.extend(cap_name for cap_name in cap_names if cap_name in sampled_names)
+    gpr.target.append(self._get_opt_objective(case))
 
     return optimizer
 
@@ -807,7 +912,7 @@ class RavenTemplate(Template):
     # Apply any specified optimization settings
     opt_settings = case.get_optimization_settings()
     optimizer.set_opt_settings(opt_settings)
-    optimizer.objective = get_opt_objective(case)
+    optimizer.objective = self._get_opt_objective(case)
 
     # Set number of denoises
     optimizer.denoises = case.get_num_samples()
@@ -815,10 +920,10 @@ class RavenTemplate(Template):
     # Create sampler variables and their respective distributions
     variables, consts = self._create_sampler_variables(case, components)
 
-    for sampled_var, vals in variables.items():
-      # initial value
-      min_val = min(vals)
-      max_val = max(vals)
+    for sampled_var, vals in variables:
+      # initial value. The values are sorted, so the bounds are the first and last values.
+      min_val = vals[0]
+      max_val = vals[-1]
       delta = max_val - min_val
       # start 5% away from zero
       initial = min_val + 0.05 * delta if max_val > 0 else max_val - 0.05 * delta
@@ -840,7 +945,7 @@ class RavenTemplate(Template):
     # Add Function sources as Files
     files = []
     for function in [s for s in sources if s.is_type("Function")]:
-      file = self._template.find(f"Files/Input[@name='{function.name}']")
+      file = self._by_name.get(("Input", function.name))  # type: File
       if file is None:  # Add function to <Files> if not found there
         file = File(function.name)
         path = Path(function._source)
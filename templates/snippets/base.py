@@ -101,9 +101,7 @@ class RavenSnippet(ET.Element):
                        "'name' and 'class' attributes defined to create an Assembler node. Current values: "
                        f"class='{self.snippet_class}', name='{self.name}'.")
 
-    node = ET.Element(tag)
-    node.attrib["class"] = self.snippet_class
-    node.attrib["type"] = self.tag
+    node = ET.Element(tag, {"class": self.snippet_class, "type": self.tag})
     node.text = self.name
 
     return node
@@ -117,7 +115,13 @@ class RavenSnippet(ET.Element):
     @ Out, None
     """
     parent = kwargs.pop("parent", self)
-    all_subs = kwargs | (subelements if subelements else {})
+    # Only merge the settings into a new dict if both were given. Settings in subelements take precedence.
+    if not kwargs:
+      all_subs = subelements or {}
+    elif not subelements:
+      all_subs = kwargs
+    else:
+      all_subs = kwargs | subelements
     for tag, value in all_subs.items():
       self._add_subelement(parent, tag, value)
 
@@ -129,15 +133,10 @@ class RavenSnippet(ET.Element):
     @ In, tag, str, the tag of the child node
     @ In, value, Any, the value of the child node
     """
-    # If the value inherits from ET.Element, we can append the value to the parent directly.
+    # If the value inherits from ET.Element (including any RavenSnippet), we can append the value to the parent
+    # directly.
     if isinstance(value, ET.Element):
       parent.append(value)
-    # If the value happens to be another entity, it has its own to_xml method. Use that instead of manually
-    # using the tag input to create the child node.
-    elif isinstance(value, RavenSnippet):
-      # has a to_xml method
-      child = value.to_xml()
-      parent.append(child)
     # Otherwise, we'll create the child node ourselves. We handle several possible types of value:
     #   1. If value is a dict, create an XML subtree using the dict key-value pairs.
     #   2. If the value is iterable but not a string (so a list, numpy array, tuple, set, etc.), create a
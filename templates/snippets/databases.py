@@ -93,11 +93,13 @@ class Database(RavenSnippet):
   #####################
   def add_variable(self, *variables: str) -> None:
     """
-    Add variables to the database
+    Add variables to the database. Variables already in the database are not repeated, and the insertion order is
+    kept so the written variable list is deterministic.
     @ In, *variables, str, variable names
     @ Out, None
     """
-    self.variables.update(variables)
+    # Reading and writing the variables node text means a full round trip through listproperty, so only do it once
+    self.variables = list(dict.fromkeys([*self.variables, *variables]))
 
 
 class NetCDF(Database):
@@ -82,11 +82,13 @@ class DataSet(DataObject):
       variables = [str(variables)]
 
     # There shouldn't be any reason to have duplicate index nodes, so only add the indicated index variable
-    index_node = self.find(f"Index[@var='{index_var}']")
+    index_node = next((node for node in self.iterfind("Index") if node.get("var") == index_var), None)
     if index_node is None:
       ET.SubElement(self, "Index", {"var": index_var}).text = variables
     else:
-      # If there are any variables provided that aren't in the existing index node's text, add them here.
-      for var in variables:
-        if var not in index_node.text:
-          index_node.text.append(var)
+      # If there are any variables provided that aren't in the existing index node's text, add them here. Index nodes
+      # read from a template file have comma-separated string text instead of a list.
+      existing = index_node.text or []
+      if isinstance(existing, str):
+        existing = [var.strip() for var in existing.split(",")]
+      index_node.text = list(dict.fromkeys([*existing, *variables]))
@@ -6,6 +6,7 @@
   @author: Jacob Bryan (@j-bryan)
   @date: 2024-11-08
 """
+import functools
 import keyword
 import re
 import xml.etree.ElementTree as ET
@@ -13,20 +14,25 @@ import xml.etree.ElementTree as ET
 from ..xml_utils import find_node
 from .base import RavenSnippet
 
+# Patterns for converting camelCase to snake_case, compiled once for all of the distribution spec subnodes
+_GROUPED_CAPITALS_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_SINGLE_CAPITALS_RE = re.compile(r"([a-z\d])([A-Z])")
+
 
 class Distribution(RavenSnippet):
   """ Distribution snippet base class """
   snippet_class = "Distributions"
 
 
+@functools.cache
 def camel_to_snake(camel: str) -> str:
   """
   Converts camelCase to snake_case, handling grouped capital letters
   @ In, camel, str, a camel case string
   @ Out, snake, str, a snake case string
   """
-  snake = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", camel)  # Handle grouped capitals
-  snake = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", snake)  # Handle single capitals
+  snake = _GROUPED_CAPITALS_RE.sub(r"\1_\2", camel)  # Handle grouped capitals
+  snake = _SINGLE_CAPITALS_RE.sub(r"\1_\2", snake)  # Handle single capitals
   snake = snake.lower()
   return snake
 
@@ -80,8 +86,8 @@ def distribution_class_from_spec(spec) -> type[Distribution]:
   for subnode in spec.subs:
     subnode_tag = subnode.getName()
     prop_name = camel_to_snake(subnode_tag)
-    # can't use name if it's in keywords.kwlist (reserved keywords), so add a trailing underscore to the name
-    if prop_name in keyword.kwlist:
+    # can't use name if it's a reserved keyword, so add a trailing underscore to the name
+    if keyword.iskeyword(prop_name):
       prop_name += "_"
     # Create a property to set the distribution parameters as "distribution.prop_name = value". This lets us keep a
     # property-based interface like our other snippet classes.
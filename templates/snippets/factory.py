@@ -20,7 +20,8 @@ def get_all_subclasses(cls: type[RavenSnippet]) -> list[type[RavenSnippet]]:
     @ In, cls, type[RavenSnippet], the class to retrieve sub-classes.
     @ Out, getAllSubclasses, list[type[RavenSnippet]], list of classes which subclass cls
   """
-  return cls.__subclasses__() + [g for s in cls.__subclasses__() for g in get_all_subclasses(s)]
+  subclasses = cls.__subclasses__()
+  return subclasses + [g for s in subclasses for g in get_all_subclasses(s)]
 
 
 class SnippetFactory:
@@ -81,6 +82,18 @@ class SnippetFactory:
     snippet = cls.from_xml(node)
     return snippet
 
+  def from_xml_or_none(self, node: ET.Element) -> RavenSnippet | None:
+    """
+    Produce a RavenSnippet object of the correct class with identical XML to an existing node, if a matching class is
+    registered. This needs only one registry lookup, unlike checking has_registered_class before calling from_xml.
+    @ In, node, ET.Element, the existing XML node
+    @ Out, snippet, RavenSnippet | None, the matching RavenSnippet object, or None if no class is registered
+    """
+    cls = self.registered_classes.get(self._get_node_key(node))
+    if cls is None:
+      return None
+    return cls.from_xml(node)
+
   def has_registered_class(self, node: ET.Element) -> bool:
     """
     Does the node have a registered class associated with it?
@@ -6,6 +6,7 @@
   @author: Jacob Bryan (@j-bryan)
   @date: 2024-11-08
 """
+from typing import Iterable
 import xml.etree.ElementTree as ET
 
 from ..xml_utils import find_node
@@ -37,12 +38,27 @@ class RavenCode(RavenSnippet):
                               default: Samplers|MonteCarlo@name:mc_arma_dispatch
     @ Out, None
     """
-    varname = name if not suffix else f"{name}_{suffix}"
+    self.add_aliases([name], suffix, loc)
+
+  def add_aliases(self, names: Iterable[str], suffix: str | None = None, loc: str | None = None) -> None:
+    """
+    Add alias nodes for several variables which share a suffix and location. The nodes are built first and appended
+    to the model all at once.
+    @ In, names, Iterable[str], the variable names to alias
+    @ In, suffix, str, optional, a suffix to append to each name
+    @ In, loc, str, optional, the location of the variables in the workflow
+                              default: Samplers|MonteCarlo@name:mc_arma_dispatch
+    @ Out, None
+    """
     if not loc:
       loc = "Samplers|MonteCarlo@name:mc_arma_dispatch"  # where this is pointing 9/10 times
-    alias_text = f"{loc}|constant@name:{varname}"
-    alias = ET.SubElement(self, "alias", {"variable": varname, "type": "input"})
-    alias.text = alias_text
+    aliases = []
+    for name in names:
+      varname = name if not suffix else f"{name}_{suffix}"
+      alias = ET.Element("alias", {"variable": varname, "type": "input"})
+      alias.text = f"{loc}|constant@name:{varname}"
+      aliases.append(alias)
+    self.extend(aliases)
 
   def set_inner_data_handling(self, dest: str, dest_type: str) -> None:
     """
@@ -104,10 +120,15 @@ class RavenCode(RavenSnippet):
     @ In, cmd, str, the python command
     @ Out, None
     """
-    if self._py_cmd is None:
+    # ElementTree paths can't match on two attributes at once, so look for the existing prepend node directly
+    node = None
+    if self._py_cmd is not None:
+      node = next((node for node in self.iterfind("clargs")
+                   if node.get("type") == "prepend" and node.get("arg") == self._py_cmd), None)
+    # Make the node if the command hasn't been set yet or its node has since been removed
+    if node is None:
       ET.SubElement(self, "clargs", {"type": "prepend", "arg": cmd})
     else:
-      node = self.find(f"clargs[@type='prepend' and @arg='{cmd}']")
       node.set("arg", cmd)
     self._py_cmd = cmd
 
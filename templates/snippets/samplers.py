@@ -30,7 +30,7 @@ class SampledVariable(RavenSnippet):
     attrib = {"type": kind, "construction": construction}
     if steps:
       attrib["steps"] = steps
-    ET.SubElement(self, "grid", attrib).text = " ".join([str(v) for v in values])
+    ET.SubElement(self, "grid", attrib).text = " ".join(map(str, values))
 
   @property
   def initial(self) -> float | None:
@@ -165,7 +165,7 @@ class Sampler(RavenSnippet):
     @ Out, var_found, bool, if the variable is in the sampler
     """
     var_name = variable if isinstance(variable, str) else variable.name
-    var_found = self.find(f"variable[@name='{var_name}']") is not None
+    var_found = any(node.get("name") == var_name for node in self.iterfind("variable"))
     return var_found
 
 class Grid(Sampler):
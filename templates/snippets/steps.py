@@ -42,7 +42,7 @@ class Step(RavenSnippet):
     node = entity.to_assembler_node(tag)
 
     # Is the entity already serving this role in the step? Check so no duplicates are added.
-    for sub in self.findall(tag):
+    for sub in self.iterfind(tag):
       if sub.attrib == node.attrib and sub.text == node.text:
         return
 
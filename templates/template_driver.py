@@ -6,8 +6,10 @@
   @author: Jacob Bryan (@j-bryan)
   @date: 2024-12-23
 """
+import os
+import pickle
 from pathlib import Path
-import dill as pk
+import dill
 
 from .imports import Base
 from .heron_types import HeronCase, Component, Source
@@ -39,8 +41,9 @@ class TemplateDriver(Base):
     @ In, sources, list[Source], external models, data, and functions
     @ Out, None
     """
-    has_static_history = any(s.is_type("CSV") for s in sources)
-    has_synthetic_history = any(s.is_type("ARMA") for s in sources)
+    source_types = {s.type for s in sources}
+    has_static_history = "CSV" in source_types
+    has_synthetic_history = "ARMA" in source_types
     if has_static_history and has_synthetic_history:
       self.raiseAnError(ValueError, "Mixing ARMA and CSV sources is not yet supported! "
                         f"ARMA sources: {[s.name for s in sources if s.is_type('ARMA')]}; "
@@ -93,9 +96,19 @@ class TemplateDriver(Base):
 
     # Write library of info so it can be read in dispatch during inner run. Doing this here ensures that the lib file
     # is written just once, no matter the number of workflow files written by the template.
+    # The data are serialized before touching the file system so a pickling error doesn't leave a partially written
+    # lib file behind. The bytes are written to a temporary file which then atomically replaces the lib file.
     lib_file = Path(dest_dir) / self.template.namingTemplates["lib file"]
-    with lib_file.open("wb") as lib:
-      pk.dump((case, components, sources), lib)
+    data = (case, components, sources)
+    try:
+      payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+      # The standard library pickle is much faster but can't handle everything that might be in the case data (e.g.
+      # locally defined functions). Fall back to dill for those. The lib file is read with dill, which can read both.
+      payload = dill.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_file = lib_file.with_name(f"{lib_file.name}.tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, lib_file)
     print(f"Wrote '{lib_file.name}' to '{str(lib_file.resolve())}'")
 
   ###################
@@ -6,7 +6,7 @@
   @author: Jacob Bryan (@j-bryan)
   @date: 2024-12-23
 """
-from typing import Any
+from typing import Any, Callable, TextIO
 import re
 import xml.etree.ElementTree as ET
 
@@ -93,6 +93,77 @@ def _to_string(val: Any, delimiter: str = ", ") -> str:
     return delimiter.join([str(v) for v in val])
   return str(val)
 
+def write_pretty(node: ET.Element, file: TextIO, indent: str = "  ") -> None:
+  """
+  Write an XML tree as indented text to an open file in a single traversal of the tree. Lines are written as they're
+  built, so the whole document is never held in memory as one string. Attribute and text values which aren't strings
+  are converted with _to_string as they're written, so stringify_node_values doesn't need to be called first. The
+  children of the root node are separated by blank lines, as in RAVEN input files.
+  @ In, node, ET.Element, the root of the tree to write
+  @ In, file, TextIO, the open text file (or other text stream) to write to
+  @ In, indent, str, optional, the string used for each level of indentation
+  @ Out, None
+  """
+  _write_pretty(node, file.write, 0, indent, blank_lines=True)
+
+def _write_pretty(node: ET.Element,
+                  write: Callable[[str], Any],
+                  level: int,
+                  indent: str,
+                  blank_lines: bool = False) -> None:
+  """
+  Writes an XML node and its children as indented lines of text. Traverses the XML tree recursively.
+  @ In, node, ET.Element, node to write
+  @ In, write, Callable[[str], Any], function which writes a string to the output
+  @ In, level, int, indentation level of the node
+  @ In, indent, str, the string used for each level of indentation
+  @ In, blank_lines, bool, optional, if True, separate the node children with blank lines
+  @ Out, None
+  """
+  pad = indent * level
+  tag = node.tag
+  attribs = "".join(f' {k}="{_escape_attrib(_to_string(v))}"' for k, v in node.attrib.items())
+  text = node.text
+  if text is not None:
+    text = _escape_text(_to_string(text))
+
+  if len(node) == 0:
+    if text:
+      write(f"{pad}<{tag}{attribs}>{text}</{tag}>\n")
+    else:
+      write(f"{pad}<{tag}{attribs} />\n")
+    return
+
+  # Whitespace-only text in a node with children is just formatting left over from parsing the template file
+  text = text.strip() if text else ""
+  write(f"{pad}<{tag}{attribs}>{text}\n")
+  for i, child in enumerate(node):
+    if blank_lines and i > 0:
+      write("\n")
+    _write_pretty(child, write, level + 1, indent)
+  write(f"{pad}</{tag}>\n")
+
+def _escape_text(text: str) -> str:
+  """
+  Escape the characters which can't appear as-is in XML node text
+  @ In, text, str, the node text
+  @ Out, escaped, str, the escaped text
+  """
+  if "&" in text or "<" in text or ">" in text:
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+  return text
+
+def _escape_attrib(value: str) -> str:
+  """
+  Escape the characters which can't appear as-is in an XML attribute value
+  @ In, value, str, the attribute value
+  @ Out, escaped, str, the escaped value
+  """
+  value = _escape_text(value)
+  if '"' in value or "\n" in value:
+    value = value.replace('"', "&quot;").replace("\n", "&#10;")
+  return value
+
 def find_node(parent: ET.Element, tag: str, make_if_missing: bool = True) -> ET.Element | None:
   """
   Find the first node with tag in parent
@@ -74,6 +74,16 @@ class TestDatabasesBase:
     self.assertListEqual(self.db.variables, ["some_var"])
     self.assertListEqual(self.db.find("variables").text, ["some_var"])
 
+  def test_add_variable(self):
+    """
+    Test add_variable method
+    @ In, None
+    @ Out, None
+    """
+    self.db.add_variable("b", "a")
+    self.db.add_variable("c", "a")
+    self.assertListEqual(self.db.variables, ["b", "a", "c"])
+
 
 class TestNetCDF(unittest.TestCase, TestDatabasesBase):
   """ NetCDF database snippet tests """
@@ -132,3 +132,9 @@ class TestDataSet(unittest.TestCase, TestDataObjectBase):
     self.obj.add_index("another_index", "var4")
     self.assertEqual(len(self.obj.findall("Index")), index_ct)
     self.assertListEqual(index_node.text, ["var1", "var2", "var3", "var4"])
+
+    # Index nodes read from XML have string text
+    ET.SubElement(self.obj, "Index", {"var": "xml_index"}).text = "var1, var2"
+    self.obj.add_index("xml_index", ["var2", "var3"])
+    index_node = self.obj.find("Index[@var='xml_index']")
+    self.assertListEqual(index_node.text, ["var1", "var2", "var3"])
@@ -32,6 +32,15 @@ class MockBase:
     """
     return getattr(cls, key, default)
 
+  @classmethod
+  def from_xml(cls, node):
+    """
+    Mock for RavenSnippet `from_xml` method
+    @ In, node, ET.Element, the XML node
+    @ Out, snippet, MockBase, an instance of the mock class
+    """
+    return cls()
+
 
 class Mock(MockBase):
   """ Mock class with no set subtype """
@@ -113,6 +122,21 @@ class TestSnippetFactory(unittest.TestCase):
     node_a = ET.Element("mock", subType="a")
     self.assertFalse(self.factory.has_registered_class(node_a))  # not registered
 
+  def test_from_xml_or_none(self):
+    """
+    test from_xml_or_none method
+    @ In, None
+    @ Out, None
+    """
+    # Add a snippet class
+    self.factory.register_snippet_class(Mock)
+    # A matching node gives an object of the registered class
+    node = ET.Element("mock")
+    self.assertIsInstance(self.factory.from_xml_or_none(node), Mock)
+    # A node without a registered class gives None
+    node_a = ET.Element("mock", subType="a")
+    self.assertIsNone(self.factory.from_xml_or_none(node_a))
+
   def test_get_snippet_class_key(self):
     """
     Test _get_snippet_class_key method
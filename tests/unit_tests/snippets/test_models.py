@@ -92,6 +92,21 @@ class TestRavenCode(unittest.TestCase, TestModelBase):
         break
     self.assertTrue(found_node)
 
+    # Changing the command should update the existing node instead of adding another
+    new_command = "other/python"
+    self.model.python_command = new_command
+    self.assertEqual(self.model.python_command, new_command)
+    nodes = self.model.findall("clargs[@type='prepend']")
+    self.assertEqual(len(nodes), 1)
+    self.assertEqual(nodes[0].get("arg"), new_command)
+
+    # If the node was removed, setting the command again should recreate it
+    self.model.remove(nodes[0])
+    self.model.python_command = python_command
+    nodes = self.model.findall("clargs[@type='prepend']")
+    self.assertEqual(len(nodes), 1)
+    self.assertEqual(nodes[0].get("arg"), python_command)
+
   def test_add_alias(self):
     """
     Test add_alias method
@@ -107,6 +122,21 @@ class TestRavenCode(unittest.TestCase, TestModelBase):
     self.assertIsNotNone(node)
     self.assertEqual(node.text, alias_text)
 
+  def test_add_aliases(self):
+    """
+    Test add_aliases method
+    @ In, None
+    @ Out, None
+    """
+    names = ["first", "second"]
+    loc = "Samplers|MonteCarlo@name:mc"
+    self.model.add_aliases(names, "capacity", loc)
+    aliases = self.model.findall("alias")
+    self.assertEqual([node.get("variable") for node in aliases], ["first_capacity", "second_capacity"])
+    for node in aliases:
+      self.assertEqual(node.get("type"), "input")
+      self.assertEqual(node.text, f"{loc}|constant@name:{node.get('variable')}")
+
   def test_set_inner_data_handling(self):
     """
     Test set_inner_data_handling method
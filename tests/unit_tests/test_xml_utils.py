@@ -0,0 +1,139 @@
+"""
+Unit tests for the XML writer in templates/xml_utils.py
+
+@author: Jacob Bryan (@j-bryan)
+@date: 2024-12-11
+"""
+
+import sys
+import os
+import io
+import unittest
+import xml.etree.ElementTree as ET
+
+# Load HERON tools
+HERON_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir]*3))
+sys.path.append(HERON_LOC)
+
+from HERON.templates.xml_utils import write_pretty
+sys.path.pop()
+
+
+def write_to_string(node: ET.Element) -> str:
+  """
+  Write an XML tree with write_pretty and return the written text
+  @ In, node, ET.Element, the root of the tree to write
+  @ Out, text, str, the written XML
+  """
+  buffer = io.StringIO()
+  write_pretty(node, buffer)
+  return buffer.getvalue()
+
+
+class TestWritePretty(unittest.TestCase):
+  """ Tests for the write_pretty XML writer """
+  def test_escape_text(self):
+    """
+    Test escaping of special characters in node text
+    @ In, None
+    @ Out, None
+    """
+    root = ET.Element("root")
+    ET.SubElement(root, "child").text = 'a & b < c > d "e"\nf'
+    written = write_to_string(root)
+    self.assertIn('<child>a &amp; b &lt; c &gt; d "e"\nf</child>', written)
+
+  def test_escape_attrib(self):
+    """
+    Test escaping of special characters in attribute values
+    @ In, None
+    @ Out, None
+    """
+    root = ET.Element("root")
+    ET.SubElement(root, "child", {"attr": 'a & b < c > d "e"\nf'})
+    written = write_to_string(root)
+    self.assertIn('<child attr="a &amp; b &lt; c &gt; d &quot;e&quot;&#10;f" />', written)
+
+  def test_leaf_and_empty_nodes(self):
+    """
+    Test writing leaf nodes with text and empty nodes
+    @ In, None
+    @ Out, None
+    """
+    root = ET.Element("root")
+    ET.SubElement(root, "leaf", {"name": "x"}).text = "value"
+    ET.SubElement(root, "empty", {"name": "y"})
+    ET.SubElement(root, "blank").text = ""
+    lines = write_to_string(root).splitlines()
+    self.assertIn('  <leaf name="x">value</leaf>', lines)
+    self.assertIn('  <empty name="y" />', lines)
+    self.assertIn('  <blank />', lines)
+
+  def test_non_string_values(self):
+    """
+    Test writing list and numeric text and attribute values
+    @ In, None
+    @ Out, None
+    """
+    root = ET.Element("root")
+    ET.SubElement(root, "list").text = ["a", "b", "c"]
+    ET.SubElement(root, "int", {"count": 3}).text = 5
+    ET.SubElement(root, "float").text = 1.5
+    lines = write_to_string(root).splitlines()
+    self.assertIn("  <list>a, b, c</list>", lines)
+    self.assertIn('  <int count="3">5</int>', lines)
+    self.assertIn("  <float>1.5</float>", lines)
+    # The tree itself isn't modified by writing it
+    self.assertListEqual(root.find("list").text, ["a", "b", "c"])
+
+  def test_whitespace_text_with_children(self):
+    """
+    Test that whitespace-only text in a node with children is dropped
+    @ In, None
+    @ Out, None
+    """
+    root = ET.fromstring("<root>\n  <parent>\n    <child>x</child>\n  </parent>\n</root>")
+    lines = write_to_string(root).splitlines()
+    self.assertListEqual(lines, ["<root>", "  <parent>", "    <child>x</child>", "  </parent>", "</root>"])
+
+  def test_blank_lines_between_top_level_children(self):
+    """
+    Test that only the children of the root node are separated by blank lines
+    @ In, None
+    @ Out, None
+    """
+    root = ET.Element("root")
+    first = ET.SubElement(root, "first")
+    ET.SubElement(first, "a").text = "1"
+    ET.SubElement(first, "b").text = "2"
+    ET.SubElement(root, "second").text = "3"
+    lines = write_to_string(root).splitlines()
+    self.assertListEqual(lines, ["<root>",
+                                 "  <first>",
+                                 "    <a>1</a>",
+                                 "    <b>2</b>",
+                                 "  </first>",
+                                 "",
+                                 "  <second>3</second>",
+                                 "</root>"])
+
+  def test_round_trip(self):
+    """
+    Test that the written XML parses back to an equivalent tree
+    @ In, None
+    @ Out, None
+    """
+    root = ET.Element("root", {"name": "a & \"b\""})
+    models = ET.SubElement(root, "Models")
+    ET.SubElement(models, "Code", {"name": "raven", "subType": "RAVEN"}).text = "x < y"
+    ET.SubElement(models, "vars").text = ["v1", "v2"]
+    ET.SubElement(root, "Empty")
+
+    parsed = ET.fromstring(write_to_string(root))
+    self.assertEqual(parsed.get("name"), 'a & "b"')
+    code = parsed.find("Models/Code")
+    self.assertEqual(code.attrib, {"name": "raven", "subType": "RAVEN"})
+    self.assertEqual(code.text, "x < y")
+    self.assertEqual(parsed.find("Models/vars").text, "v1, v2")
+    self.assertIsNotNone(parsed.find("Empty"))
+    self.assertEqual([child.tag for child in parsed], ["Models", "Empty"])